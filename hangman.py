@@ -3,17 +3,24 @@ from __future__ import annotations
 
 import math
 import os
+import select
+import signal
 import sys
 import threading
 import time
-from dataclasses import dataclass, field
-from typing import Optional
+
+# Bound method of the module-level Random singleton, so random.seed()
+# (used by the tests) still applies.
+from random import choice as _rand_choice
+from typing import Optional, Sequence
 
 
 # ---------------- Timer ---------------- #
 class TurnTimer:
     """Countdown timer based on time.monotonic()."""
 
+    __slots__ = ("duration", "_deadline")
+
     def __init__(self, duration_sec: float = 15.0) -> None:
         self.duration = float(duration_sec)
         self._deadline: Optional[float] = None
@@ -21,13 +28,18 @@ class TurnTimer:
     def start(self) -> None:
         self._deadline = time.monotonic() + self.duration
 
+    def _now_and_remaining(self) -> tuple[float, float]:
+        """One clock sample serving both expiry and remaining checks."""
+        now = time.monotonic()
+        if self._deadline is None:
+            return now, self.duration
+        return now, self._deadline - now if self._deadline > now else 0.0
+
     def is_expired(self) -> bool:
-        return self.remaining() <= 0.0
+        return self._now_and_remaining()[1] <= 0.0
 
     def remaining(self) -> float:
-        if self._deadline is None:
-            return self.duration
-        return max(0.0, float(self._deadline - time.monotonic()))
+        return self._now_and_remaining()[1]
 
     def deadline(self) -> float:
         if self._deadline is None:
@@ -36,73 +48,137 @@ class TurnTimer:
 
 
 # ---------------- Core game engine ---------------- #
-@dataclass
-class HangmanGame:
-    """Core Hangman logic."""
+# Maps every ASCII letter byte to "_"; all other bytes pass through.
+_MASK_TABLE = bytes.maketrans(
+    b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    b"_" * 52,
+)
 
-    answer: str
-    max_lives: int = 6
+# Layout of the packed game-state int: guessed-letter bits, count of
+# still-hidden letters, the per-turn timeout flag, then lives on top.
+_GUESSED_MASK = (1 << 26) - 1
+_REM_SHIFT = 26
+_REM_MASK = (1 << 20) - 1
+_TIMEOUT_BIT = 1 << 46
+_LIVES_SHIFT = 47
 
-    lives: int = field(init=False)
-    _answer_norm: str = field(init=False, repr=False)
-    _masked_chars: list[str] = field(init=False, repr=False)
-    guessed_letters: set[str] = field(default_factory=set, init=False)
 
-    _turn_timer: Optional[TurnTimer] = field(
-        default=None, init=False, repr=False
+class HangmanGame:
+    """Core Hangman logic."""
+
+    __slots__ = (
+        "answer", "max_lives", "_state",
+        "_answer_norm", "_orig_bytes", "_mask_bytes", "_positions",
+        "_masked_cache", "_turn_timer",
     )
-    _timeout_penalized: bool = field(default=False, init=False, repr=False)
 
-    def __post_init__(self) -> None:
-        self.lives = self.max_lives
-        self._answer_norm = self.answer.lower()
-        self._masked_chars = [
-            "_" if ch.isalpha() else ch for ch in self.answer
-        ]
+    def __init__(self, answer: str, max_lives: int = 6) -> None:
+        self.max_lives = max_lives
+        self._init_state(answer)
+
+    def _init_state(self, answer: str) -> None:
+        # The byte-level mask and the a-z guess bitmask only cover
+        # ASCII; reject anything else up front rather than leak
+        # unmasked letters.
+        if not answer.isascii():
+            raise ValueError("Answer must be ASCII text.")
+        self.answer = answer
+        self._answer_norm = answer.lower()
+        self._orig_bytes = answer.encode()
+        ans_bytes = self._orig_bytes.lower()
+        self._mask_bytes = bytearray(self._orig_bytes.translate(_MASK_TABLE))
+        positions: dict[str, list[int]] = {}
+        for idx, b in enumerate(ans_bytes):
+            if ord("a") <= b <= ord("z"):
+                positions.setdefault(chr(b), []).append(idx)
+        self._positions = {ch: tuple(idxs) for ch, idxs in positions.items()}
+        self._state = (
+            self.max_lives << _LIVES_SHIFT
+            | self._mask_bytes.count(ord("_")) << _REM_SHIFT
+        )
+        self._masked_cache: Optional[str] = None
+        self._turn_timer: Optional[TurnTimer] = None
+
+    def reset(self, new_answer: str) -> None:
+        """Start a fresh game on a new answer, reusing this instance."""
+        self._init_state(new_answer)
 
     @property
     def masked(self) -> str:
-        return "".join(self._masked_chars)
+        if self._masked_cache is None:
+            self._masked_cache = self._mask_bytes.decode()
+        return self._masked_cache
+
+    @property
+    def lives(self) -> int:
+        return self._state >> _LIVES_SHIFT
+
+    @property
+    def _guessed_mask(self) -> int:
+        return self._state & _GUESSED_MASK
+
+    @property
+    def _timeout_penalized(self) -> bool:
+        return bool(self._state & _TIMEOUT_BIT)
+
+    @property
+    def guessed_letters(self) -> set[str]:
+        return {
+            chr(ord("a") + i)
+            for i in range(26)
+            if self._guessed_mask >> i & 1
+        }
 
     def guess(self, letter: str) -> tuple[bool, int]:
-        if not letter or len(letter) != 1 or not letter.isalpha():
+        # isascii() must come first: lowercasing can expand some
+        # non-ASCII letters (e.g. U+0130) to two characters, which
+        # would break the ord() call below.
+        if (not letter or len(letter) != 1
+                or not letter.isascii() or not letter.isalpha()):
             raise ValueError("Guess must be a single alphabetic character.")
 
         letter = letter.lower()
 
-        if letter in self.guessed_letters:
-            return (letter in self._answer_norm, 0)
-
-        self.guessed_letters.add(letter)
+        state = self._state
+        bit = 1 << (ord(letter) - ord("a"))
+        if state & bit:
+            return (letter in self._positions, 0)
+        state |= bit
 
         count = 0
-        for idx, ch in enumerate(self._answer_norm):
-            if ch == letter and self._masked_chars[idx] == "_":
-                self._masked_chars[idx] = self.answer[idx]
+        for idx in self._positions.get(letter, ()):
+            if self._mask_bytes[idx] == ord("_"):
+                self._mask_bytes[idx] = self._orig_bytes[idx]
                 count += 1
 
         if count == 0:
-            self.lives -= 1
+            if state >> _LIVES_SHIFT > 0:
+                state -= 1 << _LIVES_SHIFT
+            self._state = state
             return (False, 0)
+        self._state = state - (count << _REM_SHIFT)
+        self._masked_cache = None
         return (True, count)
 
     def is_solved(self) -> bool:
-        return "_" not in self._masked_chars
+        return self._state >> _REM_SHIFT & _REM_MASK == 0
 
     def is_dead(self) -> bool:
-        return self.lives <= 0
+        return self._state >> _LIVES_SHIFT <= 0
 
     def start_turn(self, duration_sec: float = 15.0) -> None:
         self._turn_timer = TurnTimer(duration_sec)
         self._turn_timer.start()
-        self._timeout_penalized = False
+        self._state &= ~_TIMEOUT_BIT
 
     def handle_timeout(self) -> None:
         if (self._turn_timer and
-                not self._timeout_penalized and
+                not self._state & _TIMEOUT_BIT and
                 self._turn_timer.is_expired()):
-            self.lives -= 1
-            self._timeout_penalized = True
+            state = self._state | _TIMEOUT_BIT
+            if state >> _LIVES_SHIFT > 0:
+                state -= 1 << _LIVES_SHIFT
+            self._state = state
 
     def remaining_time(self) -> int:
         if not self._turn_timer:
@@ -110,19 +186,73 @@ class HangmanGame:
         return int(self._turn_timer.remaining())
 
     @staticmethod
-    def get_random_word(word_list: list[str]) -> str:
-        import random
-        return random.choice(word_list)
+    def get_random_word(word_list: Sequence[str]) -> str:
+        return _rand_choice(word_list)
 
     @staticmethod
-    def get_random_phrase(phrase_list: list[str]) -> str:
-        import random
-        return random.choice(phrase_list)
+    def get_random_phrase(phrase_list: Sequence[str]) -> str:
+        return _rand_choice(phrase_list)
 
 
 # ---------------- Platform I/O helpers ---------------- #
 CURRENT_GAME: HangmanGame  # used by Windows HUD helper
 
+# How often the Windows HUD wakes up to repaint the countdown (ms).
+_HUD_REFRESH_MS = 250
+
+# Static HUD fragments, encoded once so repaints skip the text layer.
+_HUD_PARTS = (b"\rWord: ", b"   Lives: ", b"   Time: ", b"s   In: ")
+
+# Console input handle for WaitForSingleObject, resolved once at import.
+# Stays None on non-Windows platforms or if the ctypes binding fails,
+# in which case the reader falls back to polling msvcrt.kbhit().
+_KERNEL32 = None
+_STDIN_HANDLE = None
+if os.name == "nt":
+    try:
+        import ctypes
+
+        _KERNEL32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        _STDIN_HANDLE = _KERNEL32.GetStdHandle(-10)  # STD_INPUT_HANDLE
+        if _STDIN_HANDLE in (0, -1):  # NULL / INVALID_HANDLE_VALUE
+            _KERNEL32 = None
+            _STDIN_HANDLE = None
+    except (OSError, AttributeError):
+        _KERNEL32 = None
+        _STDIN_HANDLE = None
+
+
+def _wait_for_key_windows(now: float, deadline: float) -> None:
+    """
+    Block until console input is ready, the HUD refresh interval
+    elapses, or the deadline passes -- whichever comes first.
+    """
+    wait_ms = min(
+        _HUD_REFRESH_MS,
+        max(0, int((deadline - now) * 1000)),
+    )
+    if _KERNEL32 is not None:
+        _KERNEL32.WaitForSingleObject(_STDIN_HANDLE, wait_ms)
+    else:
+        _kbhit_poll()
+
+
+def _kbhit_poll() -> None:
+    """Fallback wait when the kernel32 binding is unavailable."""
+    time.sleep(0.02)
+
+
+def _paint_hud(masked: str, lives: int, display_secs: int, buf: str) -> None:
+    """Redraw the single-line countdown HUD in place."""
+    out = sys.stdout.buffer
+    out.write(b"".join((
+        _HUD_PARTS[0], masked.encode(),
+        _HUD_PARTS[1], b"%d" % lives,
+        _HUD_PARTS[2], b"%02d" % display_secs,
+        _HUD_PARTS[3], buf.encode(),
+    )))
+    out.flush()
+
 
 def _read_line_with_deadline_windows(deadline: float) -> str | None:
     """
@@ -132,21 +262,21 @@ def _read_line_with_deadline_windows(deadline: float) -> str | None:
     import msvcrt  # type: ignore[attr-defined]
 
     buf = ""
-    last_shown = -1
+    last_state = None
+    _mono = time.monotonic
+    _ceil = math.ceil
 
     while True:
-        display_secs = max(0, math.ceil(deadline - time.monotonic()))
-        if display_secs != last_shown:
-            hud = (
-                f"Word: {CURRENT_GAME.masked}   Lives: {CURRENT_GAME.lives}   "
-                f"Time: {display_secs:02d}s   "
-                f"In: {buf}"
-            )
-            sys.stdout.write("\r" + hud)
-            sys.stdout.flush()
-            last_shown = display_secs
-
-        if msvcrt.kbhit():
+        now = _mono()
+        display_secs = max(0, _ceil(deadline - now))
+        # Cached masked string lets the dirty check compare ids, not text.
+        masked = CURRENT_GAME.masked
+        state = (display_secs, CURRENT_GAME.lives, id(masked), buf)
+        if state != last_state:
+            _paint_hud(masked, CURRENT_GAME.lives, display_secs, buf)
+            last_state = state
+
+        while msvcrt.kbhit():
             ch = msvcrt.getwch()
             if ch in ("\r", "\n"):
                 print()
@@ -156,15 +286,96 @@ def _read_line_with_deadline_windows(deadline: float) -> str | None:
             else:
                 buf += ch
 
-        if time.monotonic() >= deadline:
+        if now >= deadline:
             print()
             return None
 
-        time.sleep(0.02)
+        _wait_for_key_windows(now, deadline)
 
 
-def _read_line_with_timeout_posix(timeout_sec: float) -> str | None:
-    """Read one line with a timeout. Portable fallback (no live countdown)."""
+def _read_line_with_deadline_posix(deadline: float) -> str | None:
+    """
+    Read a line with Enter on POSIX terminals, with a live countdown.
+    Returns the line (lowercased) or None if time expired.
+    """
+    if not sys.stdin.isatty():
+        remaining = max(0.0, deadline - time.monotonic())
+        print(
+            "\n"
+            f"Word: {CURRENT_GAME.masked}   "
+            f"Lives: {CURRENT_GAME.lives}   "
+            f"Time left: {math.ceil(remaining)}s"
+        )
+        return _read_line_timeout_fallback(remaining)
+
+    import termios
+    import tty
+
+    fd = sys.stdin.fileno()
+    old_attrs = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+
+    buf = ""
+    last_state = None
+    _mono = time.monotonic
+    _ceil = math.ceil
+
+    try:
+        while True:
+            now = _mono()
+            display_secs = max(0, _ceil(deadline - now))
+            masked = CURRENT_GAME.masked
+            state = (display_secs, CURRENT_GAME.lives, id(masked), buf)
+            if state != last_state:
+                _paint_hud(masked, CURRENT_GAME.lives, display_secs, buf)
+                last_state = state
+
+            if now >= deadline:
+                print()
+                return None
+
+            wait_sec = min(_HUD_REFRESH_MS / 1000.0, deadline - now)
+            ready, _, _ = select.select([fd], [], [], wait_sec)
+            if not ready:
+                continue
+
+            ch = os.read(fd, 1)
+            if ch in (b"\r", b"\n"):
+                print()
+                return buf.strip().lower()
+            if ch in (b"\x7f", b"\b"):
+                buf = buf[:-1]
+            else:
+                buf += ch.decode(errors="ignore")
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+
+
+def _raise_input_timeout(signum: int, frame: object) -> None:
+    raise TimeoutError
+
+
+def _read_line_with_timeout_signal(timeout_sec: float) -> str | None:
+    """Timeout read that interrupts input() via SIGALRM. No threads,
+    but only usable from the main thread of a POSIX process."""
+    if timeout_sec <= 0:
+        return None
+    old_handler = signal.signal(signal.SIGALRM, _raise_input_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout_sec)
+    try:
+        return input("Enter a letter: ").strip().lower()
+    except TimeoutError:
+        print()
+        return None
+    except EOFError:
+        return ""
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0.0)
+        signal.signal(signal.SIGALRM, old_handler)
+
+
+def _read_line_with_timeout_threaded(timeout_sec: float) -> str | None:
+    """Thread-based timeout read for when stdin is not a terminal."""
     done = threading.Event()
     box: dict[str, str] = {}
 
@@ -182,7 +393,45 @@ def _read_line_with_timeout_posix(timeout_sec: float) -> str | None:
     return None
 
 
+# Resolved once at import so the game loop needn't re-check the
+# platform on every turn. The signal-based read only works on the main
+# thread of a POSIX process; anywhere else, keep the threaded fallback.
+if (
+    os.name == "posix"
+    and hasattr(signal, "SIGALRM")
+    and threading.current_thread() is threading.main_thread()
+):
+    _read_line_timeout_fallback = _read_line_with_timeout_signal
+else:
+    _read_line_timeout_fallback = _read_line_with_timeout_threaded
+
+if os.name == "nt":
+    _read_turn_input = _read_line_with_deadline_windows
+else:
+    _read_turn_input = _read_line_with_deadline_posix
+
+
 # ---------------- Game loop and menus ---------------- #
+WORDS: tuple[str, ...] = (
+    "python", "banana", "hangman", "testing", "quality",
+    "module", "package", "function", "variable", "exception",
+    "object", "class", "method", "loop", "string",
+    "integer", "boolean", "dictionary", "tuple", "syntax",
+    "compile", "runtime", "debug", "memory", "process",
+    "thread", "queue", "input", "output", "file",
+    "system", "network", "socket", "server", "client",
+)
+PHRASES: tuple[str, ...] = (
+    "hello world", "unit testing", "clean code", "open source",
+    "time and space", "read the docs", "pep eight", "software design",
+    "data structures", "object oriented", "artificial intelligence",
+    "machine learning", "deep learning", "version control",
+    "continuous integration", "code review", "error handling",
+    "garbage collection", "software engineering",
+    "application programming",
+)
+
+
 def choose_mode() -> str:
     """Ask user to choose Beginner or Intermediate."""
     while True:
@@ -208,33 +457,23 @@ def ask_play_again() -> bool:
         print("Please enter y or n.")
 
 
-def run_single_game(mode: str) -> None:
-    """Run one game session in the chosen mode."""
-    words = [
-        "python", "banana", "hangman", "testing", "quality",
-        "module", "package", "function", "variable", "exception",
-        "object", "class", "method", "loop", "string",
-        "integer", "boolean", "dictionary", "tuple", "syntax",
-        "compile", "runtime", "debug", "memory", "process",
-        "thread", "queue", "input", "output", "file",
-        "system", "network", "socket", "server", "client",
-    ]
-    phrases = [
-        "hello world", "unit testing", "clean code", "open source",
-        "time and space", "read the docs", "pep eight", "software design",
-        "data structures", "object oriented", "artificial intelligence",
-        "machine learning", "deep learning", "version control",
-        "continuous integration", "code review", "error handling",
-        "garbage collection", "software engineering",
-        "application programming",
-    ]
+def run_single_game(
+    mode: str, game: Optional[HangmanGame] = None
+) -> HangmanGame:
+    """Run one game session in the chosen mode.
 
+    Reuses `game` via reset() when given, and returns the instance so
+    the caller can pass it back in for the next round.
+    """
     answer = (
-        HangmanGame.get_random_word(words)
+        HangmanGame.get_random_word(WORDS)
         if mode == "basic"
-        else HangmanGame.get_random_phrase(phrases)
+        else HangmanGame.get_random_phrase(PHRASES)
     )
-    game = HangmanGame(answer=answer, max_lives=6)
+    if game is None:
+        game = HangmanGame(answer=answer, max_lives=6)
+    else:
+        game.reset(answer)
 
     global CURRENT_GAME
     CURRENT_GAME = game
@@ -245,19 +484,7 @@ def run_single_game(mode: str) -> None:
     while not game.is_dead() and not game.is_solved():
         game.start_turn(15)
 
-        if os.name == "nt":
-            # Split across lines to satisfy flake8
-            user = _read_line_with_deadline_windows(
-                game._turn_timer.deadline()
-            )
-        else:
-            print(
-                "\n"
-                f"Word: {game.masked}   "
-                f"Lives: {game.lives}   "
-                "Time left: 15s"
-            )
-            user = _read_line_with_timeout_posix(15.0)
+        user = _read_turn_input(game._turn_timer.deadline())
 
         if user is None:
             game.handle_timeout()
@@ -270,10 +497,10 @@ def run_single_game(mode: str) -> None:
                 "\nYou quit the game. The answer was:",
                 game.answer,
             )
-            return
+            return game
 
-        if len(user) == 1 and user.isalpha():
-            if user in game.guessed_letters:
+        if len(user) == 1 and user.isascii() and user.isalpha():
+            if game._guessed_mask >> (ord(user) - ord("a")) & 1:
                 print("You already guessed that letter.")
                 continue
             correct, count = game.guess(user)
@@ -289,13 +516,15 @@ def run_single_game(mode: str) -> None:
     else:
         print("\nNo lives left.")
     print("Answer:", game.answer)
+    return game
 
 
 def main() -> None:
     """Main loop with menu and play-again prompt."""
+    game: Optional[HangmanGame] = None
     while True:
         mode = choose_mode()
-        run_single_game(mode)
+        game = run_single_game(mode, game)
         if not ask_play_again():
             print("\nThanks for playing.")
             break
@@ -42,6 +42,51 @@ def test_phrase_keeps_spaces_and_punctuation():
     assert game.masked == "____o _o___!"
 
 
+def test_non_ascii_answer_is_rejected():
+    """Non-ASCII answers cannot be masked and are refused up front."""
+    with pytest.raises(ValueError):
+        HangmanGame(answer="café", max_lives=6)
+
+
+def test_non_ascii_guess_is_rejected():
+    """Guesses outside a-z raise ValueError, even lowering-expanders."""
+    game = HangmanGame(answer="banana", max_lives=6)
+    with pytest.raises(ValueError):
+        game.guess("é")
+    with pytest.raises(ValueError):
+        game.guess("İ")  # U+0130 lowercases to two characters
+    assert game.lives == 6
+
+
+def test_solved_once_every_letter_revealed():
+    """Game reports solved exactly when the last letter is revealed."""
+    game = HangmanGame(answer="aba", max_lives=6)
+    assert game.is_solved() is False
+    game.guess("a")
+    assert game.is_solved() is False
+    game.guess("b")
+    assert game.is_solved() is True
+    assert game.masked == "aba"
+
+
+def test_reset_starts_a_fresh_game_on_the_new_answer():
+    """reset() clears all progress and targets the new answer."""
+    game = HangmanGame(answer="banana", max_lives=6)
+    game.guess("a")
+    game.guess("z")
+    assert game.lives == 5
+
+    game.reset("newword")
+    assert game.masked == "_______"
+    assert game.lives == 6
+    assert game.guessed_letters == set()
+    assert game.is_solved() is False
+    was_correct, occurrences = game.guess("w")
+    assert was_correct is True
+    assert occurrences == 2
+    assert game.masked == "__ww___"
+
+
 def test_random_word_provider_returns_string():
     """Random word provider returns an item from the list."""
     words = ["apple", "banana", "cherry"]